@@ -44,7 +44,8 @@ def serialize_reminder(data):
 async def get_reminders(request):
     try:
         shard_id = int(request.query_params['shard_id'])
-        limit = int(request.query_params.get('limit', 1))
+        limit = request.query_params.get('limit')  # Defaults to all reminders
+        limit = None if limit is None else int(limit)
     except (KeyError, ValueError):
         raise HTTPException(400, 'Invalid or missing "shard_id" or "limit" query param.')
 
@@ -225,3 +226,22 @@ async def get_guilds_id_members_id_reminders(request):
         return JSONResponse(list(map(serialize_reminder, records)))
 
     raise HTTPException(404, 'Specified member has no upcoming reminders.')
+
+
+@router.route('/guilds/{guild_id:int}/members/{member_id:int}/reminders/{id:int}', methods=['DELETE'])
+@is_authorized
+@has_permissions(administrator=True)
+async def delete_guilds_id_members_id_reminders_id(request):
+    guild_id = request.path_params['guild_id']
+    member_id = request.path_params['member_id']
+    reminder_id = request.path_params['id']
+
+    async with request.app.db.acquire() as conn:
+        status = await conn.execute(
+            'DELETE FROM reminders WHERE id = $1 AND guild_id = $2 AND user_id = $3', reminder_id, guild_id, member_id
+        )
+
+    if int(status.split()[1]):
+        return JSONResponse({})
+
+    raise HTTPException(404, 'Reminder not found.')
@@ -152,8 +152,12 @@ class APIClient:
 
     # Reminders
 
-    async def get_reminders(self, shard_id, limit=1):
-        params = {'shard_id': shard_id, 'limit': limit}
+    async def get_reminders(self, shard_id, limit=None):
+        params = {'shard_id': shard_id}
+
+        if limit is not None:
+            params['limit'] = limit
+
         return await self.request('GET', '/reminders', params=params)
 
     async def get_reminder(self, reminder_id):
@@ -171,6 +175,9 @@ class APIClient:
     async def get_member_reminders(self, guild_id, member_id):
         return await self.request('GET', f'/guilds/{guild_id}/members/{member_id}/reminders')
 
+    async def delete_member_reminder(self, guild_id, member_id, reminder_id):
+        return await self.request('DELETE', f'/guilds/{guild_id}/members/{member_id}/reminders/{reminder_id}')
+
     # Roles
 
     async def get_groups(self, guild_id):
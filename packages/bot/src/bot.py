@@ -105,8 +105,12 @@ class Mousey(commands.Bot):
 
         await wait_redis_connected(redis)  # :blobpain:
 
+        # Keep idle connections around longer than the default 15s, the API is requested in bursts
+        connector = aiohttp.TCPConnector(keepalive_timeout=75)
+
         self.session = aiohttp.ClientSession(
-            headers={'User-Agent': f'Mousey/{__version__} (+https://github.com/LostLuma/Mousey)'}
+            connector=connector,
+            headers={'User-Agent': f'Mousey/{__version__} (+https://github.com/LostLuma/Mousey)'},
         )
 
         self.api = APIClient(self.session)
@@ -132,6 +136,9 @@ class Mousey(commands.Bot):
             if self.db is not None:
                 await self.db.close()
 
+            if self.session is not None:
+                await self.session.close()
+
             if self.redis is not None:
                 self.redis.connection_pool.disconnect()
 
@@ -18,6 +18,8 @@ You should have received a copy of the GNU Affero General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import functools
+
 from discord.ext import commands
 
 
@@ -38,15 +40,20 @@ class Command(commands.Command):
 
         view = ctx.view
 
+        # Bound once, this loop runs for every word consumed
+        skip_ws = view.skip_ws
+        get_quoted_word = view.get_quoted_word
+        run_converters = commands.run_converters
+
         while not view.eof:
             # For use with a manual undo
             previous = view.index
 
-            view.skip_ws()
-            argument = view.get_quoted_word()
+            skip_ws()
+            argument = get_quoted_word()
 
             try:
-                value = await commands.run_converters(ctx, converter, argument, param)
+                value = await run_converters(ctx, converter, argument, param)
             except (commands.ArgumentParsingError, commands.CommandError) as e:
                 error = e
                 view.index = previous
@@ -65,7 +72,8 @@ class Command(commands.Command):
 
         return result
 
-    @property
+    # Parameters and usage are fixed once the command is created
+    @functools.cached_property
     def signature(self):
         if self.usage is not None:
             return self.usage
@@ -40,7 +40,7 @@ class PruneDays(commands.Converter):
         start = max(ctx.guild.me.joined_at, TRACKING_START)
 
         now = discord.utils.utcnow()
-        tracked = int((now - start).total_seconds() / 86400)
+        tracked = (now - start).days
 
         if tracked > days:
             return days
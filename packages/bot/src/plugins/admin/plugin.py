@@ -25,7 +25,7 @@ import discord
 from discord.ext import commands
 
 from ... import InfractionEvent, Plugin, bot_has_permissions, group
-from ...utils import create_task
+from ...utils import create_task, get_id
 from .converter import PruneDays
 from .enums import PruneStrategy
 
@@ -33,35 +33,14 @@ from .enums import PruneStrategy
 # Moderator permissions - ignore these users unconditionally
 PERMISSIONS = discord.Permissions(administrator=True, ban_members=True, kick_members=True, manage_messages=True)
 
+# Maximum amount of kick requests in flight at once while pruning
+PRUNE_CONCURRENCY = 5
 
-def has_any_role(role_ids):
-    def check(member):
-        return any(x.id in role_ids for x in member.roles)
+PRUNE_CONFIRM = '\N{WHITE HEAVY CHECK MARK}'
+PRUNE_CANCEL = '\N{CROSS MARK}'
 
-    return check
-
-
-def can_be_pruned(bot_role):
-    def check(member):
-        return not member.bot and member.top_role < bot_role and not member.guild_permissions.value & PERMISSIONS.value
-
-    return check
-
-
-def should_prune_seen(start):
-    def check(status):
-        return status.seen is None or status.seen < start
-
-    return check
-
-
-def should_prune_status(start):
-    seen = should_prune_seen(start)
-
-    def check(status):
-        return seen(status) and (status.status is None or status.status < start)
-
-    return check
+# In the order reactions are added to the confirmation prompt
+PRUNE_CHOICES = (PRUNE_CONFIRM, PRUNE_CANCEL)
 
 
 # TODO: Allow pruning members which are still pending?
@@ -108,14 +87,29 @@ class Admin(Plugin):
         await self._prune_command(ctx, PruneStrategy.seen, roles, days)
 
     async def _prune_command(self, ctx, strategy, roles, days):
-        if not roles:
-            members = ctx.guild.members
-        else:
-            role_ids = set(x.id for x in roles)
-            members = filter(has_any_role(role_ids), ctx.guild.members)
+        bot_role = ctx.me.top_role
+        permissions = PERMISSIONS.value
+
+        role_ids = frozenset(map(get_id, roles))
+
+        members = []
+
+        # Single pass over members, only considering members with one of the roles (if given)
+        # Bots, members above the bot in the role hierarchy, and moderators are never pruned
+        for member in ctx.guild.members:
+            if member.bot:
+                continue
 
-        check = can_be_pruned(ctx.me.top_role)
-        members = list(filter(check, members))
+            if member.top_role >= bot_role:
+                continue
+
+            if role_ids and role_ids.isdisjoint(x.id for x in member.roles):
+                continue
+
+            if member.guild_permissions.value & permissions:
+                continue
+
+            members.append(member)
 
         if not members:
             await ctx.send('No members found to prune.')
@@ -128,11 +122,21 @@ class Admin(Plugin):
         start = now - datetime.timedelta(days=days)
 
         if strategy is PruneStrategy.seen:
-            check = should_prune_seen(start)
+
+            def check(status):
+                return status.seen is None or status.seen < start
+
         else:
-            check = should_prune_status(start)
 
-        count = sum(map(check, statuses))
+            def check(status):
+                seen = status.seen
+                online = status.status
+
+                return (seen is None or seen < start) and (online is None or online < start)
+
+        # Evaluate once, the result is reused when kicking members
+        to_prune = list(map(check, statuses))
+        count = to_prune.count(True)
 
         if not count:
             await ctx.send(f'No members were inactive for more than `{days}` days.')
@@ -142,16 +146,14 @@ class Admin(Plugin):
             f'Pruning members not seen in the past `{days}` days will remove `{count}` members, continue?'
         )
 
-        choices = {
-            '\N{CROSS MARK}': False,
-            '\N{WHITE HEAVY CHECK MARK}': True,
-        }
-
-        for choice in reversed(choices):
+        for choice in PRUNE_CHOICES:
             create_task(msg.add_reaction(choice))
 
+        channel_id = ctx.channel.id
+        author_id = ctx.author.id
+
         def reaction_check(data):
-            return data.channel_id == ctx.channel.id and data.user_id == ctx.author.id and data.emoji.name in choices
+            return data.channel_id == channel_id and data.user_id == author_id and data.emoji.name in PRUNE_CHOICES
 
         try:
             payload = await self.mousey.wait_for('raw_reaction_add', check=reaction_check, timeout=30)
@@ -159,9 +161,7 @@ class Admin(Plugin):
             await ctx.send('Cancelled prune due to inactivity.')
             return
 
-        do_prune = choices[payload.emoji.name]
-
-        if not do_prune:
+        if payload.emoji.name != PRUNE_CONFIRM:
             await ctx.send('Successfully cancelled prune.')
             return
 
@@ -171,16 +171,21 @@ class Admin(Plugin):
         events = self.mousey.get_cog('Events')
         reason = f'Prune initiated by {ctx.author}'
 
-        for member, status in zip(members, statuses):
-            if check(status):
-                event = InfractionEvent(guild, member, me, reason)
+        semaphore = asyncio.Semaphore(PRUNE_CONCURRENCY)
+
+        async def kick(member):
+            event = InfractionEvent(guild, member, me, reason)
+
+            async with semaphore:
                 events.ignore(guild, 'mouse_member_kick', event)
 
                 try:
                     await member.kick(reason=reason)
                 except discord.HTTPException:
-                    pass
-                else:
-                    self.mousey.dispatch('mouse_member_kick', event)
+                    return
+
+            self.mousey.dispatch('mouse_member_kick', event)
+
+        await asyncio.gather(*(kick(x) for x, prune in zip(members, to_prune) if prune))
 
         await ctx.send(f'Successfully pruned `{count}` members.')
@@ -40,8 +40,10 @@ def has_no_roles(member):
 
 
 def has_any_role(role_ids):
+    role_ids = frozenset(role_ids)
+
     def check(member):
-        return any(x.id in role_ids for x in member.roles)
+        return not role_ids.isdisjoint(x.id for x in member.roles)
 
     return check
 
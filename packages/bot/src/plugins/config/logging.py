@@ -19,7 +19,9 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import asyncio
+import functools
 import inspect
+import operator
 import re
 
 import discord
@@ -30,6 +32,11 @@ from ...utils import join_parts
 
 DEFAULT_EVENTS = -1 & ~LogType.MEMBER_NAME_CHANGE.value
 
+CHANNEL_ID_RE = re.compile(r'<?#?(\d{15,21})>?')
+
+LOG_TYPES = tuple(LogType)
+LOG_TYPE_NAMES = '\n'.join(str(x) + ' ' + e.name.replace('_', ' ').title() for x, e in enumerate(LOG_TYPES))
+
 
 def format_event_names(data):
     if data['events'] == -1:
@@ -54,7 +61,7 @@ def format_event_names(data):
 
 def match_channel(guild):
     def converter(argument):
-        match = re.match(r'<?#?(\d{15,21})>?', argument)
+        match = CHANNEL_ID_RE.match(argument)
 
         if match is not None:
             channel_id = int(match.group(1))
@@ -171,23 +178,17 @@ class LoggingMenu(ExitableMenu):
         elif mode == 'default':
             events = DEFAULT_EVENTS
         else:
-            choices = {x: event for x, event in enumerate(LogType)}
-            names = '\n'.join(str(x) + ' ' + e.name.replace('_', ' ').title() for x, e in choices.items())
-
             try:
                 response = await self.prompt(
                     f'Respond with the indexes of events to log:\n\n'
-                    f'{names}\n\nPlease separate the indexes by spaces: `20 21 22`',
-                    check=match_indexes(max(choices)),
+                    f'{LOG_TYPE_NAMES}\n\nPlease separate the indexes by spaces: `20 21 22`',
+                    check=match_indexes(len(LOG_TYPES) - 1),
                     interaction=interaction,
                 )
             except asyncio.TimeoutError:
                 return
 
-            events = 0
-
-            for index in response.split():
-                events |= choices[int(index)].value
+            events = functools.reduce(operator.or_, (LOG_TYPES[int(x)].value for x in response.split()), 0)
 
         await self.mousey.api.set_channel_modlogs(self.guild.id, channel.id, events)
 
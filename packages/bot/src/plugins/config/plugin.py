@@ -18,6 +18,8 @@ You should have received a copy of the GNU Affero General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import asyncio
+import collections
 import typing
 
 from discord.ext import commands
@@ -28,11 +30,15 @@ from .prefixes import PrefixMenu
 
 
 class PermissionConfig(typing.NamedTuple):
-    required_roles: typing.List[int] = []
+    required_roles: typing.FrozenSet[int] = frozenset()
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(required_roles=frozenset(data.get('required_roles') or ()))
 
     def to_dict(self):
         data = {
-            'required_roles': self.required_roles,
+            'required_roles': list(self.required_roles),
         }
 
         return data
@@ -45,6 +51,9 @@ class Config(Plugin):
         self._prefixes = {}
         self._permissions = {}
 
+        # Coalesces concurrent cache misses into a single API request per guild
+        self._fetch_locks = collections.defaultdict(asyncio.Lock)
+
         self._max_concurrency = commands.MaxConcurrency(1, per=commands.BucketType.channel, wait=False)
 
     def cog_check(self, ctx):
@@ -116,13 +125,20 @@ class Config(Plugin):
         except KeyError:
             pass
 
-        try:
-            prefixes = await self.mousey.api.get_prefixes(guild.id)
-        except NotFound:
-            prefixes = []
+        async with self._fetch_locks[guild.id]:
+            # Another task may have filled the cache while we waited
+            try:
+                return self._prefixes[guild.id]
+            except KeyError:
+                pass
 
-        self._prefixes[guild.id] = prefixes
-        return prefixes
+            try:
+                prefixes = await self.mousey.api.get_prefixes(guild.id)
+            except NotFound:
+                prefixes = []
+
+            self._prefixes[guild.id] = prefixes
+            return prefixes
 
     async def set_prefixes(self, guild, prefixes):
         prefixes = sorted(set(prefixes), reverse=True)
@@ -136,13 +152,19 @@ class Config(Plugin):
         except KeyError:
             pass
 
-        try:
-            permissions = await self.mousey.api.get_permissions(guild.id)
-        except NotFound:
-            permissions = {}
+        async with self._fetch_locks[guild.id]:
+            try:
+                return self._permissions[guild.id]
+            except KeyError:
+                pass
+
+            try:
+                permissions = await self.mousey.api.get_permissions(guild.id)
+            except NotFound:
+                permissions = {}
 
-        self._permissions[guild.id] = permissions = PermissionConfig(**permissions)
-        return permissions
+            self._permissions[guild.id] = permissions = PermissionConfig.from_dict(permissions)
+            return permissions
 
     async def set_permissions(self, guild, permissions):
         self._permissions[guild.id] = permissions
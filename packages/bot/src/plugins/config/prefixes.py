@@ -82,6 +82,9 @@ class PrefixMenu(ExitableMenu):
         except asyncio.TimeoutError:
             return
 
+        if prefix in prefixes:
+            return
+
         prefixes.append(prefix)
         await config.set_prefixes(self.guild, prefixes)
 
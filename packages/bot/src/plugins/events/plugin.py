@@ -563,11 +563,10 @@ class Events(Plugin):
         await self.mousey.wait_until_ready()
 
         while not self.mousey.is_closed():
-            members = filter(lambda x: x.is_timed_out(), self.mousey.get_all_members())
+            members = (x for x in self.mousey.get_all_members() if x.is_timed_out())
+            member = min(members, key=lambda x: x.timed_out_until, default=None)
 
-            try:
-                member = sorted(members, key=lambda x: x.timed_out_until)[0]
-            except IndexError:
+            if member is None:
                 return
 
             timed_out_until = member.timed_out_until
@@ -99,19 +99,18 @@ class Messages(Plugin):
         elif isinstance(before, datetime.datetime):
             before = discord.utils.time_snowflake(before)
 
-        async with self.mousey.db.acquire() as conn:
-            records = await conn.fetch(
-                """
-                SELECT id, author_id, channel_id, content, embeds, attachments, edited_at, deleted_at
-                FROM messages
-                WHERE channel_id = $1 AND id < $2
-                ORDER BY id DESC
-                LIMIT $3
-                """,
-                channel.id,
-                before,
-                limit,
-            )
+        records = await self.mousey.db.fetch(
+            """
+            SELECT id, author_id, channel_id, content, embeds, attachments, edited_at, deleted_at
+            FROM messages
+            WHERE channel_id = $1 AND id < $2
+            ORDER BY id DESC
+            LIMIT $3
+            """,
+            channel.id,
+            before,
+            limit,
+        )
 
         messages = map(decrypt_message, records)
         return [await self._create_message(x) for x in messages]
@@ -243,15 +242,14 @@ class Messages(Plugin):
         except KeyError:
             pass
 
-        async with self.mousey.db.acquire() as conn:
-            record = await conn.fetchrow(
-                """
-                SELECT id, author_id, channel_id, content, embeds, attachments, edited_at, deleted_at
-                FROM messages
-                WHERE id = $1
-                """,
-                message_id,
-            )
+        record = await self.mousey.db.fetchrow(
+            """
+            SELECT id, author_id, channel_id, content, embeds, attachments, edited_at, deleted_at
+            FROM messages
+            WHERE id = $1
+            """,
+            message_id,
+        )
 
         if record is not None:
             return decrypt_message(record)
@@ -358,5 +356,4 @@ class Messages(Plugin):
         month_ago = now - datetime.timedelta(days=30)
         snowflake = discord.utils.time_snowflake(month_ago)
 
-        async with self.mousey.db.acquire() as conn:
-            await conn.execute('DELETE FROM messages WHERE id < $1', snowflake)
+        await self.mousey.db.execute('DELETE FROM messages WHERE id < $1', snowflake)
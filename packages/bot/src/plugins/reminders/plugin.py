@@ -20,13 +20,18 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import asyncio
 import datetime
+import functools
+import heapq
 import re
 import typing
 
+import aiohttp
 import discord
+import more_itertools
+from discord.backoff import ExponentialBackoff
 from discord.ext import commands
 
-from ... import PURRL, NotFound, Plugin, bot_has_permissions, command, group
+from ... import PURRL, HTTPException, NotFound, Plugin, bot_has_permissions, command, group
 from ...utils import (
     PaginatorInterface,
     Plural,
@@ -39,21 +44,52 @@ from ...utils import (
 from .converter import reminder_content, reminder_id
 
 
+# Allowed mentions for reminders without (pingable) role mentions
+MENTIONS = discord.AllowedMentions(everyone=False, roles=False, users=True, replied_user=False)
+MENTIONS_EVERYONE = discord.AllowedMentions(everyone=True, roles=False, users=True, replied_user=False)
+
+
 def is_mentionable(role):
     return role.mentionable
 
 
+def parse_reminder(data):
+    data['expires_at'] = datetime.datetime.fromisoformat(data['expires_at'])
+    return data
+
+
 class Reminders(Plugin):
     def __init__(self, mousey):
         super().__init__(mousey)
 
-        self._next = None
+        # Upcoming reminders on this shard by ID
+        self._reminders = {}
+        # Min-heap of (expires_at, reminder ID), entries of edited or cancelled reminders are skipped when popped
+        self._schedule = []
+
+        # Set when the schedule changes to make the fulfillment loop re-check the next reminder
+        self._wakeup = asyncio.Event()
         self._task = create_task(self._fulfill_reminders())
 
+        # Limits how many due reminders are being sent at once
+        self._firing = asyncio.Semaphore(8)
+        # Tasks of reminders currently being sent by ID
+        self._fire_tasks = {}
+
+        if mousey.is_ready():
+            create_task(self.on_ready())
+
     def cog_unload(self):
         if not self._task.done():
             self._task.cancel()
 
+        for task in self._fire_tasks.values():
+            task.cancel()
+
+    @functools.cached_property
+    def _cancel_usage(self):
+        return f'{self.remind_cancel.qualified_name} {self.remind_cancel.signature}'
+
     @group(aliases=['reminder', 'remindme'])
     @bot_has_permissions(send_messages=True)
     async def remind(self, ctx, time: TimeConverter, *, message: reminder_content = None):
@@ -77,7 +113,7 @@ class Reminders(Plugin):
             response = f'in {human_delta(time)}'
         else:  # datetime.datetime
             expires = time
-            response = 'at ' + time.strftime('%Y-%m-%d %H:%M')
+            response = 'at ' + time.isoformat(sep=' ', timespec='minutes')
 
         data = {
             'user': serialize_user(ctx.author),
@@ -97,9 +133,19 @@ class Reminders(Plugin):
         resp = await self.mousey.api.create_reminder(data)
         idx = resp['id']
 
-        if self._next is None or self._next > expires:
-            self._task.cancel()
-            self._task = create_task(self._fulfill_reminders())
+        reminder = {
+            'id': idx,
+            'user_id': ctx.author.id,
+            'guild_id': data['guild_id'],
+            'channel_id': data['channel_id'],
+            'thread_id': data.get('thread_id'),
+            'message_id': data['message_id'],
+            'referenced_message_id': data.get('referenced_message_id'),
+            'expires_at': expires,
+            'message': data['message'],
+        }
+
+        self._add_reminder(reminder)
 
         about = f'about {message} ' if message else ''
         await ctx.send(f'I will remind you {about}{response}. #{idx}')
@@ -132,7 +178,8 @@ class Reminders(Plugin):
             await ctx.send('Unable to edit reminder, it may be deleted or not belong to you.')
             return
 
-        if resp['user_id'] != ctx.author.id:
+        # Reminders are scheduled by the shard of their guild, only allow editing them from the same guild
+        if resp['user_id'] != ctx.author.id or resp['guild_id'] != ctx.guild.id:
             await ctx.send('Unable to edit reminder, it may be deleted or not belong to you.')
             return
 
@@ -154,11 +201,11 @@ class Reminders(Plugin):
             return
 
         now = datetime.datetime.utcnow()
-        expires_at = datetime.datetime.fromisoformat(resp['expires_at'])
 
-        if self._next is not None:
-            self._task.cancel()
-            self._task = create_task(self._fulfill_reminders())
+        updated = parse_reminder(resp)
+        expires_at = updated['expires_at']
+
+        self._add_reminder(updated)
 
         await ctx.send(
             f'Successfully updated reminder #{reminder}, I will remind you in {human_delta(expires_at - now)}.'
@@ -179,27 +226,25 @@ class Reminders(Plugin):
             await ctx.send('You have no upcoming reminders!')
         else:
             prefix = self.mousey.get_cog('Help').clean_prefix(ctx.prefix)
-            usage = f'{self.remind_cancel.qualified_name} {self.remind_cancel.signature}'
 
             paginator = commands.Paginator(
                 max_size=1000,
                 prefix='Your upcoming reminders:\n',
-                suffix=f'\nCancel reminders using `{prefix}{usage}`',
+                suffix=f'\nCancel reminders using `{prefix}{self._cancel_usage}`',
             )
 
             now = datetime.datetime.utcnow()
 
-            for index, data in enumerate(resp, 1):
-                idx = data['id']
-                message = data['message']
+            # Display a max of 10 results per page
+            for chunk in more_itertools.chunked(map(parse_reminder, resp), 10):
+                for data in chunk:
+                    idx = data['id']
+                    message = data['message']
 
-                expires_at = datetime.datetime.fromisoformat(data['expires_at'])
-                expires_at = human_delta(expires_at - now)
+                    expires_at = human_delta(data['expires_at'] - now)
+                    paginator.add_line(f'**#{idx}** in `{expires_at}`:\n{message}')
 
-                paginator.add_line(f'**#{idx}** in `{expires_at}`:\n{message}')
-
-                if not index % 10:  # Display a max of 10 results per page
-                    paginator.close_page()
+                paginator.close_page()
 
             interface = PaginatorInterface(self.mousey, paginator, owner=ctx.author, timeout=600)
 
@@ -223,123 +268,201 @@ class Reminders(Plugin):
         Example: `{prefix}remind cancel 147`
         """
 
-        deleted = 0
-
-        for idx in reminders:
+        async def cancel(idx):
+            # Only deletes reminders belonging to the author in the current guild
             try:
-                resp = await self.mousey.api.get_reminder(idx)
+                await self.mousey.api.delete_member_reminder(ctx.guild.id, ctx.author.id, idx)
             except NotFound:
-                continue
+                return False
 
-            if resp['user_id'] != ctx.author.id:
-                continue
+            # Skipped by the fulfillment loop once it reaches the scheduled entry
+            self._reminders.pop(idx, None)
+            return True
 
-            try:
-                await self.mousey.api.delete_reminder(idx)
-            except NotFound:
-                pass
-            else:
-                deleted += 1
+        # Each reminder is looked up and deleted independently, run them concurrently
+        results = await asyncio.gather(*map(cancel, dict.fromkeys(reminders)))
+        deleted = sum(results)
 
         if deleted:
-            if self._next is not None:
-                self._task.cancel()
-                self._task = create_task(self._fulfill_reminders())
-
+            self._wakeup.set()
             msg = f'Successfully deleted {Plural(deleted):reminder}.'
         else:
             msg = 'Unable to delete reminder, it may already be deleted or not belong to you.'
 
         await ctx.send(msg)
 
-    async def _fulfill_reminders(self):
-        await self.mousey.wait_until_ready()
+    def _push_reminder(self, reminder):
+        self._reminders[reminder['id']] = reminder
+        heapq.heappush(self._schedule, (reminder['expires_at'], reminder['id']))
+
+    def _add_reminder(self, reminder):
+        self._push_reminder(reminder)
+
+        # Only wake up the fulfillment loop if this is now the next reminder due
+        if self._schedule[0][1] == reminder['id']:
+            self._wakeup.set()
+
+    @Plugin.listener()
+    async def on_ready(self):
+        # Dispatched on every new session, refetch in case we missed anything while disconnected
+        await self._load_reminders()
+
+    async def _load_reminders(self):
+        backoff = ExponentialBackoff()
 
         while not self.mousey.is_closed():
             try:
                 resp = await self.mousey.api.get_reminders(self.mousey.shard_id)
             except NotFound:
-                return
+                resp = []
+            except (asyncio.TimeoutError, aiohttp.ClientError, HTTPException):
+                # The API may still be starting up, keep retrying until we have reminders to schedule
+                await asyncio.sleep(backoff.delay())
+                continue
 
-            reminder = resp[0]
-            expires_at = datetime.datetime.fromisoformat(reminder['expires_at'])
+            break
+        else:
+            return
 
-            self._next = expires_at
-            await discord.utils.sleep_until(expires_at)
+        # Known reminders are replaced and reminders created while fetching are kept
+        for data in resp:
+            if data['id'] not in self._fire_tasks:  # Already being sent
+                self._push_reminder(parse_reminder(data))
 
-            guild = self.mousey.get_guild(reminder['guild_id'])
+        self._wakeup.set()
 
-            if guild is None:
-                await asyncio.shield(self._delete_reminder(reminder['id']))
-                continue
+    async def _fulfill_reminders(self):
+        await self.mousey.wait_until_ready()
+
+        while not self.mousey.is_closed():
+            if not self._schedule:
+                await self._wakeup.wait()
+                self._wakeup.clear()
 
-            if guild.unavailable:
-                # Reschedule until the guild is hopefully available again
-                expires_at += datetime.timedelta(minutes=5)
-                await asyncio.shield(self._reschedule_reminder(reminder['id'], expires_at))
                 continue
 
-            channel = guild.get_channel(reminder['channel_id'])
+            expires_at, idx = self._schedule[0]
+            reminder = self._reminders.get(idx)
 
-            if channel is None or not channel.permissions_for(channel.guild.me).send_messages:
-                await asyncio.shield(self._delete_reminder(reminder['id']))
+            if reminder is None or reminder['expires_at'] != expires_at:  # Cancelled or edited
+                heapq.heappop(self._schedule)
                 continue
 
-            message_id = reminder['message_id']
+            delay = (expires_at - datetime.datetime.utcnow()).total_seconds()
 
-            now = discord.utils.utcnow()
-            created_at = discord.utils.snowflake_time(message_id)
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                else:
+                    self._wakeup.clear()
 
-            user_id = reminder['user_id']
-            content = reminder['message']
-            created = human_delta(now - created_at)
+                continue  # Reminder may have been edited or cancelled in the meantime
 
-            content = f'Hey <@!{user_id}> {PURRL}! You asked to be reminded about {content} {created} ago.'
+            heapq.heappop(self._schedule)
+            del self._reminders[idx]
 
+            # Send in the background to not delay reminders due shortly after
+            task = create_task(self._fire_reminder(reminder))
+
+            self._fire_tasks[idx] = task
+            task.add_done_callback(functools.partial(self._fire_done, idx))
+
+    def _fire_done(self, idx, task):
+        if self._fire_tasks.get(idx) is task:
+            del self._fire_tasks[idx]
+
+    async def _fire_reminder(self, reminder):
+        try:
+            async with self._firing:
+                await self._send_reminder(reminder)
+        except Exception:
+            # The reminder is still stored by the API, try again later instead of dropping it until a restart
+            expires_at = datetime.datetime.utcnow() + datetime.timedelta(minutes=5)
+            self._add_reminder(reminder | {'expires_at': expires_at})
+
+            raise
+
+    async def _send_reminder(self, reminder):
+        guild = self.mousey.get_guild(reminder['guild_id'])
+
+        if guild is None:
+            await asyncio.shield(self._delete_reminder(reminder['id']))
+            return
+
+        if guild.unavailable:
+            # Reschedule until the guild is hopefully available again
+            expires_at = reminder['expires_at'] + datetime.timedelta(minutes=5)
+            await asyncio.shield(self._reschedule_reminder(reminder, expires_at))
+            return
+
+        channel = guild.get_channel(reminder['channel_id'])
+
+        if channel is None or not channel.permissions_for(guild.me).send_messages:
+            await asyncio.shield(self._delete_reminder(reminder['id']))
+            return
+
+        message_id = reminder['message_id']
+
+        now = discord.utils.utcnow()
+        created_at = discord.utils.snowflake_time(message_id)
+
+        user_id = reminder['user_id']
+        message = reminder['message']
+        created = human_delta(now - created_at)
+
+        content = f'Hey <@!{user_id}> {PURRL}! You asked to be reminded about {message} {created} ago.'
+
+        roles = re.findall(r'<@&?(\d{15,21})>', message)
+        roles = [x for x in (guild.get_role(int(x)) for x in roles) if x is not None]
+
+        # Permissions are only relevant when pinging everyone or roles which are not mentionable
+        if '@everyone' not in message and '@here' not in message and all(map(is_mentionable, roles)):
+            everyone = False
+        else:
             member = guild.get_member(user_id)
+            everyone = member is not None and channel.permissions_for(member).mention_everyone
 
-            roles = re.findall(r'<@&?(\d{15,21})>', reminder['message'])
-            roles = filter(None, (guild.get_role(int(x)) for x in roles))
+        roles = [x for x in roles if everyone or is_mentionable(x)]
 
-            if member is None:
-                everyone = False
-                roles = list(filter(is_mentionable, roles))
-            else:
-                everyone = channel.permissions_for(member).mention_everyone
-                roles = [x for x in roles if everyone or is_mentionable(x)]
+        destination_id = reminder['thread_id'] or channel.id
 
-            destination_id = reminder['thread_id'] or channel.id
+        referenced_message_id = reminder['referenced_message_id'] or message_id
 
-            referenced_message_id = reminder['referenced_message_id'] or message_id
+        if roles:
             mentions = discord.AllowedMentions(everyone=everyone, roles=set(roles), users=True, replied_user=False)
+        else:
+            mentions = MENTIONS_EVERYONE if everyone else MENTIONS
 
-            messageable = self.mousey.get_partial_messageable(destination_id)
-            reference = discord.MessageReference(message_id=referenced_message_id, channel_id=destination_id, fail_if_not_exists=False)
+        messageable = self.mousey.get_partial_messageable(destination_id)
+        reference = discord.MessageReference(
+            message_id=referenced_message_id, channel_id=destination_id, fail_if_not_exists=False
+        )
 
-            try:
-                await messageable.send(content, allowed_mentions=mentions, reference=reference)
-            except discord.DiscordServerError:
-                expires_at += datetime.timedelta(minutes=5)
-                await asyncio.shield(self._reschedule_reminder(reminder['id'], expires_at))
-                continue
-            except discord.HTTPException as e:
-                pass
+        try:
+            await messageable.send(content, allowed_mentions=mentions, reference=reference)
+        except discord.DiscordServerError:
+            expires_at = reminder['expires_at'] + datetime.timedelta(minutes=5)
+            await asyncio.shield(self._reschedule_reminder(reminder, expires_at))
+            return
+        except discord.HTTPException:
+            pass
 
-            await asyncio.shield(self._delete_reminder(reminder['id']))
+        await asyncio.shield(self._delete_reminder(reminder['id']))
 
     async def _delete_reminder(self, idx):
-        self._next = None
-
         try:
             await self.mousey.api.delete_reminder(idx)
         except NotFound:
             pass
 
-    async def _reschedule_reminder(self, idx, expires_at):
-        self._next = None
-        expires_at = expires_at.isoformat()
+    async def _reschedule_reminder(self, reminder, expires_at):
+        data = {'expires_at': expires_at.isoformat()}
 
         try:
-            await self.mousey.api.update_reminder(idx, expires_at)
+            await self.mousey.api.update_reminder(reminder['id'], data)
         except NotFound:
-            pass
+            return
+
+        self._add_reminder(reminder | {'expires_at': expires_at})
@@ -18,11 +18,8 @@ You should have received a copy of the GNU Affero General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import discord
 from discord.ext import commands
 
-from ... import NotFound
-
 
 def group_description(argument):
     if len(argument) <= 250:
@@ -33,17 +30,17 @@ def group_description(argument):
 
 class Group(commands.Converter):
     async def convert(self, ctx, argument):
-        name = argument.lower()
+        name = argument.casefold()
 
-        try:
-            resp = await ctx.bot.api.get_groups(ctx.guild.id)
-        except NotFound:
-            resp = []
+        roles = ctx.bot.get_cog('Roles')
+        groups = await roles.get_group_index(ctx.guild)
 
-        roles = (ctx.guild.get_role(x['role_id']) for x in resp)
-        roles = sorted(filter(None, roles), key=lambda x: len(x.name))
+        try:
+            return groups[name]
+        except KeyError:
+            pass
 
-        found = discord.utils.find(lambda x: name in x.name.lower(), roles)
+        found = next((role for key, role in groups.items() if name in key), None)
 
         if found is not None:
             return found
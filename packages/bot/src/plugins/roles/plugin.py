@@ -18,6 +18,9 @@ You should have received a copy of the GNU Affero General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import collections
+import functools
+
 import discord
 from discord.ext import commands
 
@@ -62,6 +65,22 @@ def enabled_permissions(permissions):
 
 
 class Roles(Plugin):
+    def __init__(self, mousey):
+        super().__init__(mousey)
+
+        # Group roles per guild ID, by casefolded name
+        self._group_index = {}
+        # Bumped on every invalidation, to not cache indexes which were fetched before it
+        self._group_index_generation = collections.Counter()
+
+    @functools.cached_property
+    def _join_usage(self):
+        return f'{self.join.qualified_name} {self.join.signature}'
+
+    @functools.cached_property
+    def _leave_usage(self):
+        return f'{self.leave.qualified_name} {self.leave.signature}'
+
     @command()
     @bot_has_permissions(send_messages=True)
     @bot_has_guild_permissions(manage_roles=True)
@@ -116,6 +135,49 @@ class Roles(Plugin):
 
         await ctx.send(f'You\'ve been removed from the `{code_safe(group)}` group role.')
 
+    @Plugin.listener()
+    async def on_guild_role_update(self, before, after):
+        if before.name != after.name:
+            self._invalidate_group_index(after.guild.id)
+
+    @Plugin.listener()
+    async def on_guild_role_delete(self, role):
+        self._invalidate_group_index(role.guild.id)
+
+    @Plugin.listener()
+    async def on_mouse_guild_remove(self, event):
+        self._invalidate_group_index(event.guild.id)
+
+    def _invalidate_group_index(self, guild_id):
+        self._group_index.pop(guild_id, None)
+        self._group_index_generation[guild_id] += 1
+
+    async def get_group_index(self, guild):
+        try:
+            return self._group_index[guild.id]
+        except KeyError:
+            pass
+
+        generation = self._group_index_generation[guild.id]
+
+        try:
+            resp = await self.mousey.api.get_groups(guild.id)
+        except NotFound:
+            resp = []
+
+        roles = (guild.get_role(x['role_id']) for x in resp)
+        index = {}
+
+        # Ordered by name length so partial matches prefer the shortest name
+        for role in sorted(filter(None, roles), key=lambda x: len(x.name)):
+            index.setdefault(role.name.casefold(), role)
+
+        # Groups or roles may have changed while fetching, this index may be outdated already
+        if self._group_index_generation[guild.id] == generation:
+            self._group_index[guild.id] = index
+
+        return index
+
     async def _ensure_no_privileged_permissions(self, role):
         enabled = discord.Permissions(PRIVILEGED_PERMISSIONS.value & role.permissions.value)
 
@@ -152,13 +214,10 @@ class Roles(Plugin):
 
         prefix = self.mousey.get_cog('Help').clean_prefix(ctx.prefix)
 
-        join = f'{self.join.qualified_name} {self.join.signature}'
-        leave = f'{self.leave.qualified_name} {self.leave.signature}'
-
         paginator = commands.Paginator(
             max_size=1750,
             prefix='Self-assignable group roles:\n',
-            suffix=f'\nUse `{prefix}{join}` and `{prefix}{leave}` to manage roles',
+            suffix=f'\nUse `{prefix}{self._join_usage}` and `{prefix}{self._leave_usage}` to manage roles',
         )
 
         groups = {}
@@ -177,7 +236,7 @@ class Roles(Plugin):
             groups[role.name] = role.mention + description
 
         # Display groups in alphanumerical order
-        for name, description in sorted(groups.items(), key=lambda item: item[0].lower()):
+        for name, description in sorted(groups.items(), key=lambda item: item[0].casefold()):
             paginator.add_line(description)
 
         interface = PaginatorInterface(self.mousey, paginator, owner=ctx.author, timeout=600)
@@ -205,6 +264,8 @@ class Roles(Plugin):
         except HTTPException as e:
             await ctx.send(f'Failed to create group. {e.message}')  # Lists privileged permissions,,
         else:
+            self._invalidate_group_index(ctx.guild.id)
+
             if description is None:
                 extra = ''
             else:
@@ -225,4 +286,6 @@ class Roles(Plugin):
         """
 
         await self.mousey.api.delete_group(ctx.guild.id, group.id)
+        self._invalidate_group_index(ctx.guild.id)
+
         await ctx.send(f'Successfully removed group `{code_safe(group)}`.')
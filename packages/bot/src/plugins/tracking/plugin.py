@@ -29,7 +29,7 @@ import more_itertools
 from discord.ext import tasks
 
 from ... import Plugin
-from ...utils import PGSQL_ARG_LIMIT, multirow_insert
+from ...utils import PGSQL_ARG_LIMIT, get_id, multirow_insert
 
 
 def not_bot(func):
@@ -77,7 +77,7 @@ class Tracking(Plugin):
 
     async def bulk_last_status(self, *members):
         guild_id = members[0].guild.id
-        user_ids = [x.id for x in members]
+        user_ids = list(map(get_id, members))
 
         async with self.mousey.db.acquire() as conn:
             status_records = await conn.fetch(
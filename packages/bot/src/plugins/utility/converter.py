@@ -24,6 +24,9 @@ import discord
 from discord.ext import commands
 
 
+ROLE_ID_RE = re.compile(r'(?:<@&)?(\d{15,21})>?')
+
+
 def info_category(categories):
     def converter(argument):
         if argument.lower() in categories:
@@ -37,7 +40,7 @@ def info_category(categories):
 
 class MentionableRole(commands.Converter):
     async def convert(self, ctx, argument):
-        match = re.match(r'(?:<@&)?(\d{15,21})>?', argument)
+        match = ROLE_ID_RE.match(argument)
 
         if match is not None:
             role_id = int(match.group(1))
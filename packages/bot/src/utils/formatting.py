@@ -26,6 +26,9 @@ def force_ltr(text):
 
     text = str(text)
 
+    if text.isascii():  # No right-to-left characters in ASCII
+        return text
+
     required = any(unicodedata.bidirectional(x) in ('R', 'AL') for x in text)
     return f'\u2068{text}\u2069' if required else text
 
@@ -19,6 +19,10 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import inspect
+import operator
+
+
+get_id = operator.attrgetter('id')
 
 
 def serialize_user(user):